@@ -1,10 +1,16 @@
 # keywords.py
 from __future__ import annotations
+import heapq
 import re
-from typing import List, Dict, Optional, Tuple
+import sys
+from collections import Counter
+from typing import List, Dict, Optional, Set, Tuple
+
+try:
+    import ahocorasick  # pyahocorasick; optional fast path
+except ImportError:
+    ahocorasick = None
 
-# Keep techy tokens like c++, c#, .net, node.js, react-dom, ci/cd
-TOKEN_RE = re.compile(r"[A-Za-z][A-Za-z0-9\+\#\.\-\/]{0,}")
 
 # Map common variants to canonical forms
 ALIASES = {
@@ -19,61 +25,146 @@ ALIASES = {
     "js": "javascript", "ts": "typescript",
 }
 
-# Whitelist of tech words we care about (expand anytime)
-TECH_SET = {
+# Whitelist of tech words we care about (expand anytime). Frozen and
+# interned so membership tests hit the pointer-equality fast path.
+TECH_SET = frozenset(sys.intern(s) for s in {
     "python","javascript","typescript","react","node","express","fastapi","django","flask",
     "aws","gcp","azure","docker","kubernetes","k8s","terraform","ansible","ci-cd",
     "sql","postgres","mysql","mongodb","redis","graphql","rest",
     "java","spring","kotlin","go","golang","rust","php","ruby","dotnet","c","c++","c#",
     "pandas","numpy","pytorch","tensorflow","scikit-learn","sklearn","spark","airflow","dbt",
     "excel","tableau", "backend", "frontend", "full-stack"
-}
+})
 
 # Phrases we want to keep intact if present
-PHRASES = [
+PHRASES = (
     "machine learning","data science","data engineering","computer vision",
     "rest api","continuous integration","continuous delivery","continuous deployment", "full stack"
-]
+)
 
-def _normalize(s: str) -> str:
-    return re.sub(r"\s+", " ", (s or "")).strip().lower()
+# Canonical lookup: identity entries for every whitelisted term plus the
+# alias remaps. One dict probe both filters (miss → not a known term)
+# and canonicalizes a cleaned token. Like the automaton below, this is
+# built once at import — before the batch process pool forks — so the
+# workers share these pages instead of rebuilding anything.
+CANON: Dict[str, str] = {t: t for t in TECH_SET}
+CANON.update({sys.intern(k): sys.intern(v) for k, v in ALIASES.items()})
+
+# Keep techy tokens like c++, c#, node.js, react-dom, ci/cd
+TOKEN_RE = re.compile(r"[A-Za-z][A-Za-z0-9\+\#\.\-\/]{0,}")
+
+# Dictionary keys tokenization can't produce: known phrases, spaced alias
+# keys ('c plus plus'), and keys that don't start with a letter ('.net').
+# The fallback path scans for these separately (longest first) with the
+# same word-alignment rule the automaton path applies.
+SPECIAL_RE = re.compile("|".join(
+    re.escape(k) for k in sorted(
+        set(PHRASES) | {k for k in CANON if " " in k or not k[0].isalpha()},
+        key=len, reverse=True)))
+
+# Characters that can appear inside a token; used to reject hits that
+# land in the middle of what TOKEN_RE would treat as one token.
+# Single-token keys mirror the tokenizer + _clean_token exactly: a hit
+# is glued left when the preceding token-char run reaches back to a
+# letter (the token started there — 'java' in 'javascript', 'node' in
+# 'node.js'), and glued right unless only strippable dots follow before
+# a non-token character ('postgresql.' is fine, 'node.js' glues 'node').
+# Phrase keys never come out of the tokenizer, so they only require a
+# non-word character on each side and 'machine learning-driven' still
+# counts the phrase like the baseline did.
+_TOKEN_CHARS = frozenset("abcdefghijklmnopqrstuvwxyz0123456789+#./-")
+_WORDISH = frozenset("abcdefghijklmnopqrstuvwxyz0123456789+#")
+_LETTERS = frozenset("abcdefghijklmnopqrstuvwxyz")
+
+def _word_aligned(txt: str, start: int, end: int, n: int, phrase: bool = False) -> bool:
+    if start > 0:
+        c = txt[start - 1]
+        if phrase:
+            if c in _WORDISH:
+                return False
+        elif c in _TOKEN_CHARS:
+            i = start - 1
+            while i >= 0 and txt[i] in _TOKEN_CHARS:
+                if txt[i] in _LETTERS:
+                    return False
+                i -= 1
+    if end + 1 < n:
+        c = txt[end + 1]
+        if phrase:
+            if c in _WORDISH:
+                return False
+        else:
+            j = end + 1
+            while j < n and txt[j] == ".":
+                j += 1
+            if j < n and txt[j] in _TOKEN_CHARS:
+                return False
+    return True
+
+# Heuristics for terms outside the dictionary (see _is_techy): a few
+# known slashed forms plus the sql/api/db suffix family.
+# The prefix before the suffix is optional so a token that IS the bare
+# suffix ('api', 'db') still matches; the lookahead requires the token
+# to start with a letter like TOKEN_RE does, and the trailing lookahead
+# applies _word_aligned's right rule (only strippable dots may follow),
+# so 'api.example.com' and 'somedb.backup' don't surface partial hits.
+# Leftmost matching makes the left side safe on its own: any glue
+# characters before a candidate are token chars the prefix would have
+# consumed from an earlier start.
+_SLASH_OK = frozenset({"ci/cd", "rest/api", "graphql/api"})
+_SUFFIXES = ("sql", "api", "db")
+_SUFFIX_RE = re.compile(
+    r"(?=[a-z])[a-z0-9\+\#\.\-\/]*?(?:%s)(?!\.*[a-z0-9\+\#\-\/])" % "|".join(_SUFFIXES))
+
+def _build_automaton():
+    """
+    One trie over PHRASES + CANON so the JD is swept in a single pass.
+    Values are (is_phrase, key_length, canonical_form); CANON goes last
+    so its canonical forms win on duplicate keys.
+    """
+    A = ahocorasick.Automaton()
+    for p in PHRASES:
+        A.add_word(p, (True, len(p), _apply_alias(p)))
+    for k, v in CANON.items():
+        # single-char keys ('c') stay out: the token paths drop tokens
+        # of length <= 1, so the sweep must not resurrect them
+        if len(k) > 1:
+            A.add_word(k, (" " in k, len(k), v))
+    A.make_automaton()
+    return A
+
+_WS_RE = re.compile(r"\s+")
+
+# _sub is bound as a default arg so the hot call is a LOAD_FAST instead
+# of a LOAD_GLOBAL + attribute lookup
+def _normalize(s: str, _sub=_WS_RE.sub) -> str:
+    return _sub(" ", (s or "")).strip().lower()
 
 # Strip only leading/trailing punctuation; keep internal . + # / (node.js, c++, ci/cd)
-def _clean_token(t: str) -> str:
+# One compiled pattern handles both ends in a single pass instead of
+# strip + strip + lstrip scanning the token three times.
+_TOK_CLEAN = re.compile(r'^[\s.,;:!?)”’"\\\]}>([<{“‘]+|[\s.,;:!?)”’"\\\]}>]+$')
+
+def _clean_token(t: str, _sub=_TOK_CLEAN.sub) -> str:
     if not t: return ""
-    t = t.strip().lower()
-    t = t.strip('.,;:!?)”’"\\]}>')  # trailing
-    t = t.lstrip('([<{“‘"')         # leading
-    return t
+    return _sub("", t.lower())
 
 def _apply_alias(t: str) -> str:
     return ALIASES.get(t, t)
 
 def _is_techy(tok: str) -> bool:
-    # Keep clear tech items; restrict slashes to known patterns
-    if tok in TECH_SET:
-        return True
-    if tok in {"ci/cd", "rest/api", "graphql/api"}:
-        return True
-    # if any(ch in tok for ch in [".","+","#"]) and len(tok) > 1:
-    #     return True
-    if tok.endswith(("sql","api","db")):
-        return True
-    return False
-
-
-def _extract_phrases(text: str) -> List[str]:
-    hits = []
-    for p in PHRASES:
-        if p in text:
-            hits.append(_apply_alias(p))
-    return hits
+    # Keep clear tech items; restrict slashes to known patterns.
+    # Three C-level probes, no per-call literals or generator scans.
+    return tok in CANON or tok in _SLASH_OK or tok.endswith(_SUFFIXES)
+
+AUTOMATON = _build_automaton() if ahocorasick is not None else None
+
 
 def extract_keywords(job_text: str, max_k: int = 20,
                      custom_keywords: Optional[List[str]] = None) -> List[str]:
     """
     Return a simple ordered list of core JD keywords (strings), length <= max_k.
-    - Tokenize JD
+    - Scan JD once for phrases + tokens
     - Clean + alias common variants
     - Keep only techy terms (whitelist + safe heuristics)
     - Rank by frequency, then alphabetically as tie-breaker
@@ -83,26 +174,58 @@ def extract_keywords(job_text: str, max_k: int = 20,
     if not txt:
         return []
 
-    # Phrases first (ensures we keep them as a unit once if present)
-    phrase_hits = set(_extract_phrases(txt))
-
-    # Tokenize
-    raw = [t for t in TOKEN_RE.findall(txt) if t]
+    phrase_hits: Set[str] = set()
     toks: List[str] = []
-    for t in raw:
-        t = _apply_alias(_clean_token(t))
-        if len(t) <= 1:
-            continue
-        if not _is_techy(t):
-            continue
-        toks.append(t)
-
-    # Frequency count
-    freqs: Dict[str,int] = {}
-    for t in toks:
-        freqs[t] = freqs.get(t, 0) + 1
+
+    if AUTOMATON is not None:
+        # Fast path: one automaton sweep finds every dictionary term
+        # (already canonical), then one small regex pass picks up the
+        # suffix-heuristic tokens the dictionary can't enumerate.
+        n = len(txt)
+        for end, (is_phrase, klen, canon) in AUTOMATON.iter(txt):
+            start = end - klen + 1
+            if not _word_aligned(txt, start, end, n, is_phrase):
+                continue
+            if is_phrase:
+                phrase_hits.add(canon)
+            else:
+                toks.append(canon)
+        for m in _SUFFIX_RE.finditer(txt):
+            t = m.group(0)
+            if t not in TECH_SET and t not in ALIASES:
+                toks.append(t)
+    else:
+        # Fallback: same semantics as the fast path in two regex passes —
+        # one for dictionary keys tokenization can't produce (phrases,
+        # spaced aliases, '.net'), one for ordinary tokens. Spaced keys
+        # count once like phrases; the rest count per occurrence.
+        n = len(txt)
+        for m in SPECIAL_RE.finditer(txt):
+            k = m.group(0)
+            if not _word_aligned(txt, m.start(), m.end() - 1, n, " " in k):
+                continue
+            canon = CANON.get(k) or _apply_alias(k)
+            if " " in k:
+                phrase_hits.add(canon)
+            else:
+                toks.append(canon)
+        for m in TOKEN_RE.finditer(txt):
+            t = _clean_token(m.group(0))
+            if len(t) <= 1:
+                continue
+            canon = CANON.get(t)
+            if canon is not None:
+                toks.append(canon)
+                continue
+            # rare slow path: heuristics for terms outside the dictionary
+            if not _is_techy(t):
+                continue
+            toks.append(t)
+
+    # Frequency count (Counter does this in C)
+    freqs: Counter[str] = Counter(toks)
     for p in phrase_hits:
-        freqs[p] = max(freqs.get(p, 0), 1)
+        freqs[p] = max(freqs[p], 1)
 
     # Include custom keywords (force-in, even if not in TECH_SET)
     if custom_keywords:
@@ -110,10 +233,9 @@ def extract_keywords(job_text: str, max_k: int = 20,
             k = _apply_alias(_clean_token(_normalize(ck)))
             if not k:
                 continue
-            freqs[k] = max(freqs.get(k, 0), 1)
-
-    # Rank by (frequency desc, then token asc) and trim
-    ranked = sorted(freqs.items(), key=lambda kv: (-kv[1], kv[0]))
-    result = [tok for tok, _ in ranked][:max_k]
+            freqs[k] = max(freqs[k], 1)
 
-    return result
+    # Rank by (frequency desc, then token asc); only top max_k survive,
+    # so keep a heap of k instead of sorting everything
+    ranked = heapq.nsmallest(max_k, freqs.items(), key=lambda kv: (-kv[1], kv[0]))
+    return [tok for tok, _ in ranked]
@@ -1,3 +1,8 @@
+import asyncio
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional
+
 from fastapi import FastAPI, UploadFile, File, Form
 from fastapi.middleware.cors import CORSMiddleware
 from parser import parse_pdf_resume
@@ -6,6 +11,21 @@ from matcher import classify_and_score
 
 app = FastAPI()
 
+# Parsing is CPU-bound, so batches fan out over processes (not threads:
+# the PDF libraries hold per-process global state). One pool for the app,
+# created on startup after the keyword tables/automaton are built.
+pool: Optional[ProcessPoolExecutor] = None
+
+@app.on_event("startup")
+def _start_pool():
+    global pool
+    pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+
+@app.on_event("shutdown")
+def _stop_pool():
+    if pool is not None:
+        pool.shutdown()
+
 origins = ['http://localhost:5173', 'https://resume-tailor-at9k.onrender.com']
 
 app.add_middleware(
@@ -37,3 +57,35 @@ async def analyze(resume_file: UploadFile = File(...),
         "keywords": keywords,
         **result
     }
+
+@app.post("/analyze_batch")
+async def analyze_batch(resume_files: List[UploadFile] = File(...),
+                        job_text: str = Form(...),
+                        max_k: int = Form(10)):
+    keywords = extract_keywords(job_text, max_k=max_k)
+
+    payloads = [(await f.read(), f.filename) for f in resume_files]
+    loop = asyncio.get_running_loop()
+    parsed_list = await asyncio.gather(
+        *[loop.run_in_executor(pool, parse_pdf_resume, pdf_bytes, filename)
+          for pdf_bytes, filename in payloads],
+        return_exceptions=True,
+    )
+
+    results = []
+    for (_, filename), parsed in zip(payloads, parsed_list):
+        if isinstance(parsed, Exception):
+            # one bad file shouldn't sink the batch
+            results.append({"filename": filename, "error": str(parsed)})
+            continue
+        result = classify_and_score(
+            keywords=keywords,
+            resume_skills=parsed.get("skills", []),
+            resume_text=parsed.get("text", "")
+        )
+        results.append({
+            "filename": filename,
+            "contact": parsed.get("contact", {}),
+            **result
+        })
+    return {"keywords": keywords, "results": results}
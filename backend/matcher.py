@@ -1,12 +1,35 @@
 # matcher.py
 from __future__ import annotations
 import re
-from typing import List, Dict
+from typing import Any, Dict, List, Set
+
+try:
+    import ahocorasick  # pyahocorasick; optional fast path
+except ImportError:
+    ahocorasick = None
 
 # --- helpers ---------------------------------------------------
 
-def _normalize(s: str) -> str:
-    return re.sub(r"\s+", " ", (s or "")).strip().lower()
+_WS_RE = re.compile(r"\s+")
+
+# _sub is bound as a default arg so the hot call is a LOAD_FAST instead
+# of a LOAD_GLOBAL + attribute lookup
+def _normalize(s: str, _sub=_WS_RE.sub) -> str:
+    return _sub(" ", (s or "")).strip().lower()
+
+def _text_hits(kws: List[str], text_lc: str) -> Set[str]:
+    """
+    Keywords that occur as substrings of text_lc. With pyahocorasick
+    installed all keywords are found in one sweep of the text instead of
+    one `in` scan per keyword; same substring semantics either way.
+    """
+    if ahocorasick is None or not kws or not text_lc:
+        return {k for k in kws if k in text_lc}
+    A = ahocorasick.Automaton()
+    for k in kws:
+        A.add_word(k, k)
+    A.make_automaton()
+    return {k for _, k in A.iter(text_lc)}
 
 def _canon_list(items: List[str]) -> List[str]:
     out, seen = [], set()
@@ -21,7 +44,7 @@ def _canon_list(items: List[str]) -> List[str]:
 
 def classify_and_score(keywords: List[str],
                        resume_skills: List[str],
-                       resume_text: str) -> Dict:
+                       resume_text: str) -> Dict[str, Any]:
     """
     Compare JD `keywords` against resume `skills` and `text`.
 
@@ -36,17 +59,18 @@ def classify_and_score(keywords: List[str],
     }
     """
     kws = _canon_list(keywords)
-    skills = set(_canon_list(resume_skills))
+    skills: Set[str] = set(_canon_list(resume_skills))
     text_lc = _normalize(resume_text or "")
 
-    in_skills = []
-    in_text_not_skills = []
-    missing = []
+    in_skills: List[str] = []
+    in_text_not_skills: List[str] = []
+    missing: List[str] = []
 
+    hits = _text_hits(kws, text_lc)
     for k in kws:
         if k in skills:
             in_skills.append(k)
-        elif k and k in text_lc:
+        elif k in hits:
             in_text_not_skills.append(k)
         else:
             missing.append(k)
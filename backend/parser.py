@@ -3,6 +3,7 @@ Extract contact info, skills, and general text from resumes
 """
 
 from __future__ import annotations
+import io
 import re
 from typing import Any, Dict, List, Optional
 
@@ -14,19 +15,25 @@ class EncryptedOrCorruptPDF(ParseError): ...
 # ---------------- Regexes (simple + robust) ----------------
 CTRL_RE = re.compile(r"[\x00-\x08\x0B-\x0C\x0E-\x1F]")
 WS_RE   = re.compile(r"[ \t\f\v]+")
+NONWS_RE = re.compile(r"\S+")  # word counting without materializing the words
+LINE_EDGE_RE = re.compile(r" ?\n ?")  # strip the (already collapsed) space at line edges
 LIGS    = {"ﬁ":"fi","ﬂ":"fl"}
 
 EMAIL_RE = re.compile(r"[A-Za-z0-9._%+\-]+@[A-Za-z0-9.\-]+\.[A-Za-z]{2,}")
 PHONE_RE = re.compile(r"(?:\+?\d{1,3}[\s\-\.]?)?(?:\(?\d{3}\)?[\s\-\.]?)\d{3}[\s\-\.]?\d{4}")
-# We only store links if the line contains these domains (per your rule)
-LINKEDIN_LINE_RE = re.compile(r"linkedin\.com/[^\s|,;]+", re.IGNORECASE)
-GITHUB_LINE_RE   = re.compile(r"github\.com/[^\s|,;]+",   re.IGNORECASE)
+# We only store links if the text contains these domains (per your rule);
+# one combined pattern finds either kind of link in a single scan
+LINK_RE = re.compile(r"(linkedin\.com/[^\s|,;]+)|(github\.com/[^\s|,;]+)", re.IGNORECASE)
 BULLET_MARKERS = ("•", "-", "–", "—", "*", "∙", "·")
 
 _WORD = re.compile(r"\w+")
 _SKILLS_WORD = re.compile(r"\bskills?\b", re.IGNORECASE)
 _CATEGORY_LINE = re.compile(r"^\s*\w[\w &/+-]*\s*:\s*")  # e.g., "Languages: Python, ..."
 _TITLE_CASE = re.compile(r"^[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*$")  # "Technical Skills"
+# Unambiguous skills headers, matched in one pass over the whole text.
+# [ \t] only — \s would let the match span newlines despite the anchors.
+SKILLS_HDR_RE = re.compile(r"^[ \t]*(?:technical[ \t]+|core[ \t]+|professional[ \t]+)?skills[ \t]*:?[ \t]*$",
+                           re.IGNORECASE | re.MULTILINE)
 
 
 # --------------- Public API ---------------
@@ -34,45 +41,79 @@ def parse_pdf_resume(file_bytes: bytes, filename: Optional[str] = None) -> Dict[
     """
     PDF → text → contact + skills (from 'Skills' section).
     """
-    try:
-        import fitz  # PyMuPDF
-    except Exception as e:
-        raise ParseError("Missing dependency: pymupdf (pip install pymupdf)") from e
-
-    try:
-        doc = fitz.open(stream=file_bytes, filetype="pdf")
-    except Exception as e:
-        raise EncryptedOrCorruptPDF("PDF is encrypted or corrupt; cannot be opened.") from e
-
-    try:
-        pages = []
-        for page in doc:
-            pages.append(page.get_text("text"))
-        raw_text = "\n\n".join(pages)
-        page_count = doc.page_count
-    finally:
-        doc.close()
+    raw_text, page_count = _extract_pdf_text(file_bytes)
 
     text = _normalize_text(raw_text)
     if not text.strip():
         raise EmptyTextError("No extractable text found (likely a scanned PDF).")
 
+    # Split once; contact and skills extraction share the same line list
+    lines = text.split("\n")
+
     # Contact (fast + forgiving)
-    contact = _extract_contact(text)
+    contact = _extract_contact(text, lines)
 
     # Skills (find the skills block → split by commas and newlines → strip any 'Category:' prefixes)
-    skills = _extract_skills(text)
+    skills = _extract_skills(text, lines)
 
     meta = {
         "kind": "pdf",
         "filename": filename,
         "pages": page_count,
         "chars": len(text),
-        "words": len(text.split()),
+        "words": sum(1 for _ in NONWS_RE.finditer(text)),
     }
 
     return {"text": text, "contact": contact, "skills": skills, "meta": meta}
 
+# --------------- Text extraction ---------------
+def _extract_pdf_text(file_bytes: bytes) -> tuple[str, int]:
+    """
+    bytes → (raw text, page count). Prefers pypdfium2 (fast, permissive
+    license); falls back to PyMuPDF if that isn't installed.
+    """
+    try:
+        import pypdfium2 as pdfium
+    except Exception:
+        pdfium = None
+
+    if pdfium is not None:
+        try:
+            pdf = pdfium.PdfDocument(file_bytes)
+        except Exception as e:
+            raise EncryptedOrCorruptPDF("PDF is encrypted or corrupt; cannot be opened.") from e
+        try:
+            buf = io.StringIO()
+            for i, page in enumerate(pdf):
+                if i:
+                    buf.write("\n\n")
+                buf.write(page.get_textpage().get_text_bounded())
+            return buf.getvalue(), len(pdf)
+        finally:
+            pdf.close()
+
+    # Fallback: PyMuPDF
+    try:
+        import fitz
+    except Exception as e:
+        raise ParseError("Missing dependency: pypdfium2 (pip install pypdfium2)") from e
+
+    try:
+        doc = fitz.open(stream=file_bytes, filetype="pdf")
+    except Exception as e:
+        raise EncryptedOrCorruptPDF("PDF is encrypted or corrupt; cannot be opened.") from e
+
+    try:
+        page_count = doc.page_count
+        buf = io.StringIO()
+        for i, page in enumerate(doc):
+            if i:
+                buf.write("\n\n")
+            buf.write(page.get_text("text"))
+        return buf.getvalue(), page_count
+    finally:
+        doc.close()
+
 # --------------- Normalization ---------------
 def _normalize_text(text: str) -> str:
     if not text:
@@ -81,35 +122,36 @@ def _normalize_text(text: str) -> str:
         text = text.replace(k, v)
     text = text.replace("\r\n", "\n").replace("\r", "\n")
     text = CTRL_RE.sub("", text)
-    # Collapse spaces/tabs per line but preserve line breaks
-    lines = [WS_RE.sub(" ", ln).strip() for ln in text.split("\n")]
-    return "\n".join(lines).strip()
+    # Collapse spaces/tabs but preserve line breaks — two whole-string
+    # passes instead of a split/per-line-strip/join round trip
+    text = WS_RE.sub(" ", text)
+    return LINE_EDGE_RE.sub("\n", text).strip()
 
 # --------------- Contact (only what we need) ---------------
-def _extract_contact(text: str) -> Dict[str, Optional[str]]:
+def _extract_contact(text: str, lines: List[str]) -> Dict[str, Optional[str]]:
     # Name guess: first non-contact-ish line within first ~20 lines
-    header = "\n".join(text.split("\n")[:20])
+    header = "\n".join(lines[:20])
     name = _guess_name(header)
 
-    emails = EMAIL_RE.findall(text)
-    phones = PHONE_RE.findall(text)
+    # Only the first match is kept, so stop at the first hit instead of
+    # collecting every email/phone in the document
+    email_m = EMAIL_RE.search(text)
+    phone_m = PHONE_RE.search(text)
 
     linkedin = None
     github = None
-    for line in text.splitlines():
-        m_li = LINKEDIN_LINE_RE.search(line)
-        if m_li and not linkedin:
-            linkedin = _clean_url(m_li.group(0))
-        m_gh = GITHUB_LINE_RE.search(line)
-        if m_gh and not github:
-            github = _clean_url(m_gh.group(0))
+    for m in LINK_RE.finditer(text):
+        if m.group(1) and not linkedin:
+            linkedin = _clean_url(m.group(1))
+        elif m.group(2) and not github:
+            github = _clean_url(m.group(2))
         if linkedin and github:
             break
 
     return {
         "name": name,
-        "email": emails[0] if emails else None,
-        "phone": phones[0] if phones else None,
+        "email": email_m.group(0) if email_m else None,
+        "phone": phone_m.group(0) if phone_m else None,
         "linkedin": linkedin,
         "github": github,
     }
@@ -131,7 +173,7 @@ def _clean_url(u: str) -> str:
     return u
 
 # --------------- Skills (just from the Skills section) ---------------
-def _extract_skills(text: str) -> List[str]:
+def _extract_skills(text: str, lines: List[str]) -> List[str]:
     """
     Find a 'Skills' or 'Technical Skills' section (case-insensitive),
     capture its block, then split tokens:
@@ -139,7 +181,7 @@ def _extract_skills(text: str) -> List[str]:
       - also newlines (if listed vertically),
       - if a token contains a colon, drop everything up to and including ':'.
     """
-    block = _find_skills_block(text)
+    block = _find_skills_block(text, lines)
     if not block:
         return []
 
@@ -164,21 +206,25 @@ def _extract_skills(text: str) -> List[str]:
             out.append(s)
     return out
 
-def _find_skills_block(text: str) -> Optional[str]:
+def _find_skills_block(text: str, lines: List[str]) -> Optional[str]:
     """
-    Locate the Skills section by scoring lines for 'header-ness' (contains 'skill',
-    short, header-ish casing, separated by blanks, etc.). Then collect the lines
-    that follow until a new header/double blank/hard cap.
+    Locate the Skills section: first try one anchored regex over the whole
+    text for an unambiguous header line ('Skills', 'Technical Skills', ...).
+    Only if that misses, fall back to scoring every line for 'header-ness'
+    (contains 'skill', short, header-ish casing, separated by blanks, etc.).
+    Then collect the lines that follow until a new header/double blank/hard cap.
     """
-    lines = text.split("\n")
-
     header_idx = None
-    best_score = -999
-    for i in range(len(lines)):
-        is_hdr, sc = _score_skills_header_line(lines, i)
-        if is_hdr and sc > best_score:
-            header_idx, best_score = i, sc
-            break  # first good header wins (earliest 'Skills' on the page)
+    m = SKILLS_HDR_RE.search(text)
+    if m:
+        header_idx = text.count("\n", 0, m.start())
+    else:
+        best_score = -999
+        for i in range(len(lines)):
+            is_hdr, sc = _score_skills_header_line(lines, i)
+            if is_hdr and sc > best_score:
+                header_idx, best_score = i, sc
+                break  # first good header wins (earliest 'Skills' on the page)
 
     if header_idx is None:
         return None
@@ -206,38 +252,6 @@ def _find_skills_block(text: str) -> Optional[str]:
 
     block = "\n".join(block_lines).strip()
     return block or None
-    """
-    Grab the text right after a line that looks like a Skills header
-    until the next ALL-CAPS-ish header or a large blank gap.
-    """
-    lines = text.split("\n")
-    header_idx = None
-    skills_hdr = re.compile(r"^\s*(technical\s+skills|skills)\s*:?\s*$", re.IGNORECASE)
-
-    for i, ln in enumerate(lines):
-        if skills_hdr.match(ln):
-            header_idx = i
-            break
-
-    if header_idx is None:
-        return None
-
-    # Collect lines after the header until another header-ish line or big gap
-    block_lines: List[str] = []
-    for ln in lines[header_idx+1:]:
-        if not ln.strip():
-            # stop if we hit a double blank (paragraph break)
-            if block_lines and block_lines[-1] == "":
-                break
-            block_lines.append("")  # keep a single blank as separator
-            continue
-        # New header if the line is short and looks like a section title
-        if _looks_like_header(ln):
-            break
-        block_lines.append(ln)
-
-    # Join back; caller will split
-    return "\n".join(block_lines).strip()
 
 def _looks_like_header(line: str) -> bool:
     s = line.strip()